@@ -1,5 +1,7 @@
+import time
 from typing import Annotated, AsyncGenerator
 import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
@@ -27,7 +29,36 @@ DbDep = Annotated[AsyncIOMotorClient, Depends(get_db)]
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
+# Users resolved from access tokens, so hot authenticated paths skip the JWT
+# signature check and the user lookup. Entries live for USER_CACHE_TTL seconds
+# and never past the token's own expiry; writes to a user evict its tokens.
+USER_CACHE_TTL = 60
+_token_cache: TTLCache[str, tuple[User, float]] = TTLCache(
+    maxsize=10_000, ttl=USER_CACHE_TTL
+)
+_user_tokens: TTLCache[str, set[str]] = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL)
+
+
+def invalidate_user_cache(user_id: str) -> None:
+    for token in _user_tokens.pop(str(user_id), ()):
+        _token_cache.pop(token, None)
+
+
 async def get_current_user(db: DbDep, token: TokenDep) -> User:
+    cached = _token_cache.get(token)
+    if cached and cached[1] > time.time():
+        user_data = cached[0]
+    else:
+        user_data = await _resolve_token_user(db, token)
+
+    if not user_data.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
+        )
+    return user_data
+
+
+async def _resolve_token_user(db: AsyncIOMotorDatabase, token: str) -> User:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
@@ -47,10 +78,9 @@ async def get_current_user(db: DbDep, token: TokenDep) -> User:
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    if not user_data.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
-        )
+    _token_cache[token] = (user_data, float(payload.get("exp", 0)))
+    # Reassigning refreshes the TTL so the index outlives every token in it
+    _user_tokens[user_data.id] = _user_tokens.get(user_data.id, set()) | {token}
     return user_data
 
 
@@ -61,8 +61,10 @@ async def read_items(
         db=db, query=filter_query, skip=skip, limit=limit, sort=[("created_at", -1)]
     )
 
-    # Transform to Pydantic models
-    items = [ItemPublic(**item.model_dump()) for item in items_cursor]
+    # Transform to Pydantic models, reading attributes instead of dumping
+    items = [
+        ItemPublic.model_validate(item, from_attributes=True) for item in items_cursor
+    ]
 
     return ItemsPublic(data=items, count=count)
 
@@ -93,10 +95,7 @@ async def create_item(
     """
     item_data = item_in.model_dump()
     item_data["owner_id"] = current_user.id
-    create_item = await Item(**item_data).save(db)
-
-    created_item = await Item.find_one(db=db, query={"_id": create_item.id})
-    return Item(**created_item.model_dump())
+    return await Item(**item_data).save(db)
 
 
 @router.put("/{id}", response_model=ItemPublic)
@@ -123,9 +122,9 @@ async def update_item(
 
     update_data = item_in.model_dump(exclude_unset=True)
 
-    await Item.update_many(db=db, query={"_id": id}, update={"$set": update_data})
-
-    return await Item.find_one(db=db, query={"_id": id})
+    return await Item.find_one_and_update(
+        db=db, query={"_id": id}, update={"$set": update_data}
+    )
 
 
 @router.delete("/{id}")
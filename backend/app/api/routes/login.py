@@ -1,10 +1,16 @@
+import asyncio
 from datetime import timedelta
 from typing import Annotated, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.responses import HTMLResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from app import crud
-from app.api.deps import CurrentUser, DbDep, get_current_active_superuser
+from app.api.deps import (
+    CurrentUser,
+    DbDep,
+    get_current_active_superuser,
+    invalidate_user_cache,
+)
 from app.core import security
 from app.core.config import settings
 from app.core.security import get_password_hash
@@ -18,6 +24,8 @@ from app.utils import (
 
 router = APIRouter(tags=["login"])
 
+ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
 
 @router.post("/login/access-token")
 async def login_access_token(
@@ -40,12 +48,13 @@ async def login_access_token(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
         )
 
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    return Token(
+    # Every field comes from a stored user, so skip validation
+    user_id = str(user.id)
+    return Token.model_construct(
         access_token=security.create_access_token(
-            str(user.id), expires_delta=access_token_expires
+            user_id, expires_delta=ACCESS_TOKEN_EXPIRES
         ),
-        id=str(user.id),
+        id=user_id,
         full_name=user.full_name,
         email=user.email,
     )
@@ -60,7 +69,9 @@ async def test_token(current_user: CurrentUser) -> Any:
 
 
 @router.post("/password-recovery/{email}")
-async def recover_password(email: str, db: DbDep) -> Message:
+async def recover_password(
+    email: str, db: DbDep, background_tasks: BackgroundTasks
+) -> Message:
     """
     Password Recovery
     """
@@ -77,7 +88,8 @@ async def recover_password(email: str, db: DbDep) -> Message:
         email_to=user.email, email=email, token=password_reset_token
     )
 
-    send_email(
+    background_tasks.add_task(
+        send_email,
         email_to=user.email,
         subject=email_data.subject,
         html_content=email_data.html_content,
@@ -107,8 +119,11 @@ async def reset_password(db: DbDep, body: NewPassword) -> Message:
             status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
         )
 
-    user.hashed_password = get_password_hash(password=body.new_password)
+    user.hashed_password = await asyncio.to_thread(
+        get_password_hash, password=body.new_password
+    )
     await user.save(db)
+    invalidate_user_cache(user.id)
 
     return Message(message="Password updated successfully")
 
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 from fastapi import APIRouter
 from pydantic import BaseModel
@@ -27,7 +28,7 @@ async def create_user(user_in: PrivateUserCreate, db: DbDep) -> Any:
     user = await User(
         email=user_in.email,
         full_name=user_in.full_name,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await asyncio.to_thread(get_password_hash, user_in.password),
     ).save(db)
 
     return user
@@ -1,10 +1,16 @@
-from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import re
+from typing import Annotated, Any
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from motor.motor_asyncio import AsyncIOMotorCursor
+from pydantic import TypeAdapter
+from pymongo.errors import DuplicateKeyError
 from app import crud
 from app.api.deps import (
     CurrentUser,
     DbDep,
     get_current_active_superuser,
+    invalidate_user_cache,
 )
 from app.core.config import settings
 from app.core.security import get_password_hash, verify_password
@@ -20,76 +26,129 @@ from app.models import (
     UserUpdateMe,
     PyObjectId,
 )
-from app.utils import generate_new_account_email, send_email
+from app.utils import (
+    decode_page_cursor,
+    encode_page_cursor,
+    generate_new_account_email,
+    send_email,
+)
 
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+USER_PUBLIC_PROJECTION = {
+    field: 1 for field in UserPublic.model_fields if field != "id"
+}
+users_public_adapter = TypeAdapter(list[UserPublic])
+MAX_PAGE_SIZE = 100
+
+
+async def _read_public_docs(cursor: AsyncIOMotorCursor) -> list[dict[str, Any]]:
+    """Drain a cursor batch by batch, renaming _id the way the ORM does."""
+    docs = []
+    async for doc in cursor:
+        doc["id"] = str(doc.pop("_id"))
+        docs.append(doc)
+    return docs
+
 
 @router.get(
     "/",
     dependencies=[Depends(get_current_active_superuser)],
     response_model=UsersPublic,
 )
-async def read_users(db: DbDep, skip: int = 0, limit: int = 100, q: str = None) -> Any:
+async def read_users(
+    db: DbDep,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = MAX_PAGE_SIZE,
+    q: str = None,
+    after: str = None,
+) -> Any:
     """
-    Retrieve users.
+    Retrieve users, newest first.
+
+    - **q**: Optional prefix to match against full name or email
+    - **after**: Cursor from a previous page's `next_cursor`
     """
 
-    # Add search query if provided
-    base_filter = {}
+    # Anchored, case-sensitive prefix match against lowercased fields so
+    # both branches can be served by an index range scan
     if q:
-
-        search_filter = {
+        prefix = f"^{re.escape(q.lower())}"
+        filter_query = {
             "$or": [
-                {
-                    "full_name": {"$regex": q, "$options": "i"}
-                },  # Case-insensitive search in name
-                {
-                    "email": {"$regex": q, "$options": "i"}
-                },  # Case-insensitive search in email
+                {"full_name_lc": {"$regex": prefix}},
+                {"email": {"$regex": prefix}},
             ]
         }
-
-        # Combine base filter with search filter
-        filter_query = {"$and": [base_filter, search_filter]}
     else:
-        filter_query = base_filter
+        filter_query = {}
 
-    # Get count of matching documents
-    count = await User.count(db=db, query=filter_query)
-
-    # Find matching items with pagination
-    users_cursor = await User.find(
-        db=db, query=filter_query, limit=limit, skip=skip, sort=[("created_at", -1)]
+    # Resume strictly after the last (created_at, _id) seen by the client
+    page_query = filter_query
+    if after:
+        cursor = decode_page_cursor(after)
+        if not cursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+        created_at, last_id = cursor
+        keyset_filter = {
+            "$or": [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "_id": {"$lt": last_id}},
+            ]
+        }
+        page_query = {"$and": [filter_query, keyset_filter]}
+
+    # Count matching documents and fetch the page concurrently, reading raw
+    # documents with only the public fields instead of full User models
+    cursor = (
+        User.get_collection(db)
+        .find(page_query, USER_PUBLIC_PROJECTION)
+        .sort([("created_at", -1), ("_id", -1)])
+        .limit(limit)
+        .batch_size(MAX_PAGE_SIZE)
+    )
+    count, docs = await asyncio.gather(
+        User.count(db=db, query=filter_query),
+        _read_public_docs(cursor),
     )
 
-    # Transform to Pydantic models
-    users = [UserPublic(**user.model_dump()) for user in users_cursor]
+    # Validate the whole page in one pass
+    users = users_public_adapter.validate_python(docs)
 
-    return UsersPublic(data=users, count=count)
+    next_cursor = None
+    if users and len(users) == limit:
+        last_user = users[-1]
+        next_cursor = encode_page_cursor(last_user.created_at, last_user.id)
+
+    return UsersPublic(data=users, count=count, next_cursor=next_cursor)
 
 
 @router.post(
     "/", dependencies=[Depends(get_current_active_superuser)], response_model=UserPublic
 )
-async def create_user(*, db: DbDep, user_in: UserCreate) -> Any:
+async def create_user(
+    *, db: DbDep, user_in: UserCreate, background_tasks: BackgroundTasks
+) -> Any:
     """
     Create new user.
     """
-    user = await crud.get_user_by_email(db=db, email=user_in.email)
-    if user:
+    # The unique email index rejects duplicates, no need for a lookup first
+    try:
+        user = await crud.create_user(db=db, user_create=user_in)
+    except DuplicateKeyError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="The user with this email already exists in the system.",
         )
 
-    user = await crud.create_user(db=db, user_create=user_in)
     if settings.emails_enabled and user_in.email:
         email_data = generate_new_account_email(
             email_to=user_in.email, username=user_in.email, password=user_in.password
         )
-        send_email(
+        background_tasks.add_task(
+            send_email,
             email_to=user_in.email,
             subject=email_data.subject,
             html_content=email_data.html_content,
@@ -105,22 +164,22 @@ async def update_user_me(
     Update own user.
     """
 
-    if user_in.email:
-        existing_user = await crud.get_user_by_email(db=db, email=user_in.email)
-
-        if existing_user and existing_user.id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="User with this email already exists",
-            )
+    if user_in.email and await User.exists_by_email(
+        db=db, email=user_in.email, exclude_id=current_user.id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="User with this email already exists",
+        )
 
-    update_data = user_in.model_dump(exclude_unset=True)
+    fields = user_in.model_fields_set & {"email", "full_name"}
+    update_data = User.prepare_update({k: getattr(user_in, k) for k in fields})
 
-    await User.update_many(
+    updated_user = await User.find_one_and_update(
         db=db, query={"_id": current_user.id}, update={"$set": update_data}
     )
-
-    return await User.find_one(db=db, query={"_id": current_user.id})
+    invalidate_user_cache(current_user.id)
+    return updated_user
 
 
 @router.patch("/me/password", response_model=Message)
@@ -130,7 +189,9 @@ async def update_password_me(
     """
     Update own password.
     """
-    if not verify_password(body.current_password, current_user.hashed_password):
+    if not await asyncio.to_thread(
+        verify_password, body.current_password, current_user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect password"
         )
@@ -140,12 +201,13 @@ async def update_password_me(
             detail="New password cannot be the same as the current one",
         )
 
-    hashed_password = get_password_hash(body.new_password)
-    await User.update_many(
+    hashed_password = await asyncio.to_thread(get_password_hash, body.new_password)
+    await User.find_one_and_update(
         db=db,
         query={"_id": current_user.id},
         update={"$set": {"hashed_password": hashed_password}},
     )
+    invalidate_user_cache(current_user.id)
     return Message(message="Password updated successfully")
 
 
@@ -169,6 +231,7 @@ async def delete_user_me(db: DbDep, current_user: CurrentUser) -> Any:
         )
 
     await current_user.delete(db)
+    invalidate_user_cache(current_user.id)
     return Message(message="User deleted successfully")
 
 
@@ -207,24 +270,28 @@ async def update_user(
     """
     Update a user.
     """
-    db_user = await User.find_one(db, {"_id": user_id})
+    # Loading the user and checking the new email don't depend on each other
+    lookups = [User.find_one(db, {"_id": user_id})]
+    if user_in.email:
+        lookups.append(
+            User.exists_by_email(db=db, email=user_in.email, exclude_id=user_id)
+        )
+    db_user, *email_taken = await asyncio.gather(*lookups)
+
     if not db_user:
         raise HTTPException(
             status_code=404,
             detail="The user with this id does not exist in the system",
         )
 
-    if user_in.email:
-        existing_user = await crud.get_user_by_email(db=db, email=user_in.email)
-        if existing_user and existing_user.id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="User with this email already exists",
-            )
+    if any(email_taken):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="User with this email already exists",
+        )
 
-    updated_user = await crud.update_user(
-        db=db, db_user=User(**db_user.model_dump()), user_in=user_in
-    )
+    updated_user = await crud.update_user(db=db, db_user=db_user, user_in=user_in)
+    invalidate_user_cache(db_user.id)
     return updated_user
 
 
@@ -247,7 +314,10 @@ async def delete_user(
             detail="Super users are not allowed to delete themselves",
         )
 
-    # Delete all items owned by this user
-    await user.delete(db)
-    Item.delete_many(db=db, query={"owner_id": user_id})
+    # Delete the user and all items it owns; owner_id is stored as a string
+    await asyncio.gather(
+        user.delete(db),
+        Item.delete_many(db=db, query={"owner_id": user.id}),
+    )
+    invalidate_user_cache(user.id)
     return Message(message="User deleted successfully")
@@ -1,10 +1,20 @@
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from app import crud
 from app.core.config import settings
-from app.models import UserCreate, User
+from app.models import Item, UserCreate, User
 
 
 async def init_db(db: AsyncIOMotorDatabase) -> None:
+    # Create the indexes declared on the models
+    await User.ensure_indexes(db)
+    await Item.ensure_indexes(db)
+
+    # Backfill the search shadow field for users saved before it existed
+    await User.get_collection(db).update_many(
+        {"full_name_lc": {"$exists": False}, "full_name": {"$type": "string"}},
+        [{"$set": {"full_name_lc": {"$toLower": "$full_name"}}}],
+    )
+
     # Check if superuser exists
     user = await User.find_by_email(db, settings.FIRST_SUPERUSER)
 
@@ -4,7 +4,7 @@ import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
 
 
 ALGORITHM = "HS256"
@@ -23,3 +23,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def dummy_verify_password() -> None:
+    """Spend as long as a real verification without checking anything."""
+    pwd_context.dummy_verify()
@@ -1,18 +1,23 @@
+import asyncio
 import uuid
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from pydantic import ValidationError
-from app.core.security import get_password_hash, verify_password
+from app.core.security import (
+    dummy_verify_password,
+    get_password_hash,
+    verify_password,
+)
 from app.models import Item, ItemCreate, User, UserCreate, UserUpdate
 
 
 async def create_user(*, db: AsyncIOMotorDatabase, user_create: UserCreate) -> User:
     user_data = user_create.model_dump(exclude={"password"})
-    user_data["hashed_password"] = get_password_hash(user_create.password)
+    user_data["hashed_password"] = await asyncio.to_thread(
+        get_password_hash, user_create.password
+    )
 
     try:
-        result = await User(**user_data).save(db)
-        created_user = await User.find_one(db=db, query={"_id": result.id})
-        return User.model_validate(created_user)
+        return await User(**user_data).save(db)
     except ValidationError as e:
         raise ValueError(f"Invalid user data: {e}")
 
@@ -20,16 +25,19 @@ async def create_user(*, db: AsyncIOMotorDatabase, user_create: UserCreate) -> U
 async def update_user(
     *, db: AsyncIOMotorDatabase, db_user: User, user_in: UserUpdate
 ) -> User:
-    user_data = user_in.model_dump(exclude_unset=True, exclude={"password"})
+    fields = user_in.model_fields_set - {"password"}
+    user_data = {k: getattr(user_in, k) for k in fields}
 
     if user_in.password:
-        user_data["hashed_password"] = get_password_hash(user_in.password)
+        user_data["hashed_password"] = await asyncio.to_thread(
+            get_password_hash, user_in.password
+        )
 
-    updated_data = db_user.model_copy(update=user_data)
-    await updated_data.save(db)
-
-    updated_user = await User.find_one(db, {"_id": db_user.id})
-    return User.model_validate(updated_user)
+    return await User.find_one_and_update(
+        db=db,
+        query={"_id": db_user.id},
+        update={"$set": User.prepare_update(user_data)},
+    )
 
 
 async def get_user_by_email(*, db: AsyncIOMotorDatabase, email: str) -> User | None:
@@ -49,8 +57,10 @@ async def authenticate(
 ) -> User | None:
     db_user = await get_user_by_email(db=db, email=email)
     if not db_user:
+        # Take as long as a real check so unknown emails can't be told apart
+        await asyncio.to_thread(dummy_verify_password)
         return None
-    if not verify_password(password, db_user.hashed_password):
+    if not await asyncio.to_thread(verify_password, password, db_user.hashed_password):
         return None
     return db_user
 
@@ -61,6 +71,4 @@ async def create_item(
     item_data = item_in.model_dump()
     item_data["owner_id"] = owner_id
 
-    result = await Item(**item_data).save(db)
-    created_item = await Item.find_one(db, {"_id": result.inserted_id})
-    return Item.model_validate(created_item)
+    return await Item(**item_data).save(db)
@@ -5,7 +5,12 @@ from pydantic_core import core_schema
 from bson import ObjectId
 from typing import Any
 from pymongo_orm import AsyncMongoModel
-from pymongo import ASCENDING, DESCENDING
+from pymongo_orm.utils.converters import (
+    doc_to_model,
+    ensure_object_id,
+    process_query,
+)
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
 
 
 class PyObjectId:
@@ -38,7 +43,35 @@ class PyObjectId:
         return ObjectId(value)
 
 
-class UserBase(AsyncMongoModel):
+class MongoModel(AsyncMongoModel):
+    """Shared query helpers the ORM doesn't provide."""
+
+    @classmethod
+    async def count(cls, db, query=None) -> int:
+        """Count documents, reading collection metadata when unfiltered."""
+        if not query:
+            return await cls.get_collection(db).estimated_document_count()
+        return await super().count(db, query)
+
+    @classmethod
+    async def find_one_and_update(
+        cls,
+        db,
+        query: dict[str, Any],
+        update: dict[str, Any],
+        return_document: ReturnDocument = ReturnDocument.AFTER,
+    ):
+        """Apply an update and return the document in a single round-trip."""
+        update = {**update, "$set": {**update.get("$set", {})}}
+        update["$set"]["updated_at"] = datetime.now(timezone.utc)
+
+        doc = await cls.get_collection(db).find_one_and_update(
+            process_query(query), update, return_document=return_document
+        )
+        return doc_to_model(doc, cls) if doc else None
+
+
+class UserBase(MongoModel):
     __collection__ = "users"
     __indexes__ = [
         {"fields": [("email", ASCENDING)], "unique": True, "background": True},
@@ -46,6 +79,11 @@ class UserBase(AsyncMongoModel):
             "fields": [("full_name", ASCENDING), ("created_at", DESCENDING)],
             "background": True,
         },
+        {"fields": [("full_name_lc", ASCENDING)], "background": True},
+        {
+            "fields": [("created_at", DESCENDING), ("_id", DESCENDING)],
+            "background": True,
+        },
     ]
 
     __write_concern__ = {"w": "majority", "j": True}
@@ -58,7 +96,8 @@ class UserBase(AsyncMongoModel):
 
     def before_save(self):
         """Hook that runs before saving."""
-        self.full_name = self.full_name.strip()
+        if self.full_name:
+            self.full_name = self.full_name.strip()
         self.email = self.email.lower()
 
     _pre_save_hooks = [before_save]
@@ -73,6 +112,14 @@ class UserBase(AsyncMongoModel):
         """Find a user by email (case-insensitive)."""
         return await cls.find_one(db, {"email": email.lower()})
 
+    @classmethod
+    async def exists_by_email(cls, *, db, email: str, exclude_id=None) -> bool:
+        """Check if a user other than exclude_id has the email, reading only _id."""
+        query: dict[str, Any] = {"email": email.lower()}
+        if exclude_id is not None:
+            query["_id"] = {"$ne": ensure_object_id(exclude_id)}
+        return await cls.get_collection(db).find_one(query, {"_id": 1}) is not None
+
 
 class UserCreate(UserBase):
     password: str = Field(..., min_length=8, max_length=40)
@@ -105,6 +152,8 @@ class UpdatePassword(BaseModel):
 class User(UserBase):
 
     hashed_password: str
+    # Lowercase copy of full_name so prefix search can use a plain index
+    full_name_lc: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -113,6 +162,25 @@ class User(UserBase):
         arbitrary_types_allowed=True,
     )
 
+    def before_save(self):
+        """Hook that runs before saving."""
+        UserBase.before_save(self)
+        self.full_name_lc = self.full_name.lower() if self.full_name else None
+
+    _pre_save_hooks = [before_save]
+
+    @staticmethod
+    def prepare_update(update_data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the before_save normalization to a partial $set payload."""
+        if update_data.get("email"):
+            update_data["email"] = update_data["email"].lower()
+        if "full_name" in update_data:
+            full_name = update_data["full_name"]
+            if full_name:
+                full_name = update_data["full_name"] = full_name.strip()
+            update_data["full_name_lc"] = full_name.lower() if full_name else None
+        return update_data
+
 
 class UserPublic(UserBase):
 
@@ -124,11 +192,13 @@ class UserPublic(UserBase):
 class UsersPublic(BaseModel):
     data: List[UserPublic]
     count: int
+    next_cursor: Optional[str] = None
 
 
-class ItemBase(AsyncMongoModel):
+class ItemBase(MongoModel):
     __collection__ = "items"
     __indexes__ = [
+        {"fields": [("owner_id", ASCENDING)], "background": True},
         {
             "fields": [("title", ASCENDING), ("created_at", DESCENDING)],
             "background": True,
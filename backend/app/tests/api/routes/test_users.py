@@ -6,7 +6,7 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 from app import crud
 from app.core.config import settings
 from app.core.security import verify_password
-from app.models import UserCreate
+from app.models import ItemCreate, UserCreate
 from app.tests.utils.utils import random_email, random_lower_string
 
 
@@ -138,6 +138,97 @@ async def test_retrieve_users(
         assert "email" in item
 
 
+# Test paginating users with the keyset cursor
+@pytest.mark.asyncio
+async def test_retrieve_users_next_cursor(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db: AsyncIOMotorDatabase,
+) -> None:
+    for _ in range(3):
+        await crud.create_user(
+            db=db,
+            user_create=UserCreate(
+                email=random_email(), password=random_lower_string()
+            ),
+        )
+
+    response = client.get(
+        f"{settings.API_V1_STR}/users/",
+        headers=superuser_token_headers,
+        params={"limit": 2},
+    )
+    first_page = response.json()
+    assert len(first_page["data"]) == 2
+    assert first_page["next_cursor"]
+
+    response = client.get(
+        f"{settings.API_V1_STR}/users/",
+        headers=superuser_token_headers,
+        params={"limit": 2, "after": first_page["next_cursor"]},
+    )
+    second_page = response.json()
+    assert second_page["count"] == first_page["count"]
+    first_emails = {item["email"] for item in first_page["data"]}
+    assert not first_emails & {item["email"] for item in second_page["data"]}
+
+
+def test_retrieve_users_invalid_cursor(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/users/",
+        headers=superuser_token_headers,
+        params={"after": "not-a-cursor"},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_retrieve_users_limit_too_large(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/users/",
+        headers=superuser_token_headers,
+        params={"limit": 101},
+    )
+    assert response.status_code == 422
+
+
+# Test searching users by name prefix
+@pytest.mark.asyncio
+async def test_retrieve_users_search(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db: AsyncIOMotorDatabase,
+) -> None:
+    full_name = f"Searchable {random_lower_string()}"
+    user = await crud.create_user(
+        db=db,
+        user_create=UserCreate(
+            email=random_email(), password=random_lower_string(), full_name=full_name
+        ),
+    )
+
+    response = client.get(
+        f"{settings.API_V1_STR}/users/",
+        headers=superuser_token_headers,
+        params={"q": full_name[:14].upper()},
+    )
+    found_users = response.json()
+
+    assert response.status_code == 200
+    assert user.email in [item["email"] for item in found_users["data"]]
+
+    response = client.get(
+        f"{settings.API_V1_STR}/users/",
+        headers=superuser_token_headers,
+        params={"q": ".*"},
+    )
+    assert response.json()["count"] == 0
+
+
 # Test updating current user
 @pytest.mark.asyncio
 async def test_update_user_me(
@@ -163,6 +254,26 @@ async def test_update_user_me(
     assert user_db["full_name"] == full_name
 
 
+# Test that the cached current user is refreshed after an update
+def test_read_user_me_after_update(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    client.get(f"{settings.API_V1_STR}/users/me", headers=normal_user_token_headers)
+
+    full_name = random_lower_string()
+    response = client.patch(
+        f"{settings.API_V1_STR}/users/me",
+        headers=normal_user_token_headers,
+        json={"full_name": full_name},
+    )
+    assert response.status_code == 200
+
+    response = client.get(
+        f"{settings.API_V1_STR}/users/me", headers=normal_user_token_headers
+    )
+    assert response.json()["full_name"] == full_name
+
+
 # Test user registration
 @pytest.mark.asyncio
 async def test_register_user(client: TestClient, db: AsyncIOMotorDatabase) -> None:
@@ -205,6 +316,30 @@ async def test_delete_user_super_user(
     assert deleted_user is None
 
 
+# Test deleting a user also deletes the items it owns
+@pytest.mark.asyncio
+async def test_delete_user_deletes_items(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db: AsyncIOMotorDatabase,
+) -> None:
+    user = await crud.create_user(
+        db=db,
+        user_create=UserCreate(email=random_email(), password=random_lower_string()),
+    )
+    await crud.create_item(
+        db=db, item_in=ItemCreate(title=random_lower_string()), owner_id=user.id
+    )
+
+    response = client.delete(
+        f"{settings.API_V1_STR}/users/{user.id}",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+
+    assert await db.items.find_one({"owner_id": user.id}) is None
+
+
 # Test deleting non-existent user
 def test_delete_user_not_found(
     client: TestClient, superuser_token_headers: dict[str, str]
@@ -1,7 +1,7 @@
 from mongomock_motor import AsyncMongoMockClient
 import logging
 from bson import ObjectId
-from app.models import User
+from app.models import Item, User
 from app.core.security import get_password_hash
 from app.core.config import settings
 
@@ -25,6 +25,11 @@ class MongoHandler:
         )
 
     async def hydrate_resources(self):
+        # create the indexes init_db would, unique email in particular
+        db = self.__db_client[self.__db_name]
+        await User.ensure_indexes(db)
+        await Item.ensure_indexes(db)
+
         # hydrate users
         self.__collection_name = "users"
         superuser_email = settings.FIRST_SUPERUSER
@@ -1,4 +1,6 @@
+import base64
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -6,6 +8,9 @@ from typing import Any
 
 import emails  # type: ignore
 import jwt
+from bson import ObjectId
+from bson.errors import InvalidId
+from cachetools import LRUCache
 from jinja2 import Template
 from jwt.exceptions import InvalidTokenError
 
@@ -113,11 +118,41 @@ def generate_password_reset_token(email: str) -> str:
     return encoded_jwt
 
 
+# Tokens that already passed verification, with their subject and expiry.
+# Failures are never stored so a bad token can't poison the cache.
+_reset_token_cache: LRUCache[str, tuple[str, float]] = LRUCache(maxsize=1024)
+
+
 def verify_password_reset_token(token: str) -> str | None:
+    cached = _reset_token_cache.get(token)
+    if cached:
+        email, exp = cached
+        if exp > time.time():
+            return email
+        _reset_token_cache.pop(token, None)
+        return None
+
     try:
         decoded_token = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
         )
-        return str(decoded_token["sub"])
     except InvalidTokenError:
         return None
+
+    email = str(decoded_token["sub"])
+    _reset_token_cache[token] = (email, float(decoded_token["exp"]))
+    return email
+
+
+def encode_page_cursor(created_at: datetime, id: str) -> str:
+    raw = f"{created_at.isoformat()}|{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_page_cursor(cursor: str) -> tuple[datetime, ObjectId] | None:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, _, id = raw.partition("|")
+        return datetime.fromisoformat(created_at), ObjectId(id)
+    except (ValueError, InvalidId):
+        return None
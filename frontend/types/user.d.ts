@@ -9,6 +9,7 @@ export interface User {
 export interface UserData {
   data: User[];
   count: number;
+  next_cursor?: string | null;
 }
 export interface UpdateMePassword {
   current_password: string;